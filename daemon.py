@@ -0,0 +1,234 @@
+import argparse
+import itertools
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import quoradl
+import tagger
+
+
+logger = logging.getLogger("daemon")
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.INFO)
+
+
+# hosts we will download answers from; relative urls are taken as quora.com
+QUORA_HOSTS = ("quora.com", "qr.ae")
+
+
+def validate_job(request):
+    """
+    Checks the body of a job request, returning a (url, filename) tuple.
+
+    The api has no authentication and any web page can post to localhost, so
+    <url> has to be a quora url (either relative, ie "/What-is-x/answer/y", or
+    https on a quora host) and <filename>, if given, has to be a plain name
+    which will land in the archive folder.  Raises a ValueError describing
+    the problem otherwise.
+    """
+    if not isinstance(request, dict):
+        raise ValueError("expected a json object")
+
+    url = request.get("url")
+    if not isinstance(url, str) or not url:
+        raise ValueError('expected a "url" string')
+    if not url.startswith("/"):
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        on_quora = any(host == h or host.endswith("." + h) for h in QUORA_HOSTS)
+        if parts.scheme != "https" or not on_quora:
+            raise ValueError(f"not a quora url: {url}")
+
+    filename = request.get("filename")
+    if filename is None:
+        return url, None
+    if not isinstance(filename, str):
+        raise ValueError('"filename" must be a string')
+
+    # same rules save_quora_answer() applies to the names it derives
+    filename = filename.lower()
+    if not filename.endswith(".md"):
+        filename += ".md"
+    if "/" in filename or "\\" in filename or filename.startswith("."):
+        raise ValueError(f"filename must be a plain file name: {filename}")
+    if filename.startswith(("tag_", "year_", "index_")):
+        raise ValueError(f"filename would overwrite an index file: {filename}")
+    return url, filename
+
+
+class JobServer(ThreadingHTTPServer):
+    """
+    A local HTTP server which queues download jobs for an archive folder.
+
+    Downloads run one at a time on a worker thread (with the same randomized
+    delay as `quoradl.py scrape`) so the shared HTTP session is only ever
+    used from one thread.  A second thread polls the folder and re-tags new
+    or changed answers, rewriting only the indices they affect.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, folder, interval=2, delay_min=1, delay_max=3):
+        super().__init__(address, JobHandler)
+        self.folder = folder
+        self.interval = interval
+        self.delay_min = delay_min
+        self.delay_max = delay_max
+
+        self.tagger = tagger.Tagger(folder)
+        self.jobs = {}
+        self.job_ids = itertools.count(1)
+        self.job_queue = queue.Queue()
+        self.lock = threading.Lock()
+
+    def submit(self, url, filename=None):
+        """
+        Queues a download of <url>, returning the new job
+        """
+        with self.lock:
+            job = {
+                "id": next(self.job_ids),
+                "url": url,
+                "filename": filename,
+                "status": "queued",
+            }
+            self.jobs[job["id"]] = job
+        self.job_queue.put(job["id"])
+        return job
+
+    def get_job(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list_jobs(self):
+        with self.lock:
+            return [dict(j) for j in self.jobs.values()]
+
+    def _set_status(self, job_id, status):
+        with self.lock:
+            self.jobs[job_id]["status"] = status
+
+    def download_worker(self):
+        while True:
+            job_id = self.job_queue.get()
+            job = self.get_job(job_id)
+            self._set_status(job_id, "running")
+            try:
+                ok = quoradl.save_quora_answer(
+                    job["url"], filename=job["filename"], folder=self.folder
+                )
+                self._set_status(job_id, "done" if ok else "failed")
+            except Exception:
+                logger.exception(f"job {job_id} failed")
+                self._set_status(job_id, "failed")
+            time.sleep(random.randrange(self.delay_min, self.delay_max))
+
+    def index_watcher(self):
+        # tags and years still waiting to be written; None means all of them,
+        # so the first pass tags everything and writes every index
+        pending_tags = pending_years = None
+        while True:
+            try:
+                tags, years = self.tagger.scan()
+                if pending_tags is not None:
+                    pending_tags |= tags
+                    pending_years |= years
+                if pending_tags is None or pending_tags or pending_years:
+                    self.tagger.write_indices(pending_tags, pending_years)
+                pending_tags, pending_years = set(), set()
+            except Exception:
+                # anything still pending is retried on the next pass
+                logger.exception("re-index failed")
+            time.sleep(self.interval)
+
+    def serve(self):
+        for target in (self.download_worker, self.index_watcher):
+            threading.Thread(target=target, daemon=True).start()
+        host, port = self.server_address[:2]
+        logger.info(f"serving {self.folder} on http://{host}:{port}")
+        self.serve_forever()
+
+
+class JobHandler(BaseHTTPRequestHandler):
+    """
+        POST /jobs          {"url": <answer url>, "filename": <optional>}
+                            (must be sent as application/json)
+        GET  /jobs          list all jobs
+        GET  /jobs/<id>     status of one job
+    """
+
+    def _reply(self, code, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if parts == ["jobs"]:
+            return self._reply(200, self.server.list_jobs())
+        if len(parts) == 2 and parts[0] == "jobs" and parts[1].isdigit():
+            job = self.server.get_job(int(parts[1]))
+            if job:
+                return self._reply(200, job)
+        self._reply(404, {"error": f"not found: {self.path}"})
+
+    def do_POST(self):
+        if self.path.strip("/") != "jobs":
+            return self._reply(404, {"error": f"not found: {self.path}"})
+
+        # browsers can send text/plain posts cross-origin without asking
+        # first, but not application/json, so this keeps web pages out
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip()
+        if content_type.lower() != "application/json":
+            return self._reply(415, {"error": "expected application/json"})
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            url, filename = validate_job(request)
+        except ValueError as err:
+            return self._reply(400, {"error": str(err)})
+        job = self.server.submit(url, filename)
+        self._reply(202, job)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="keep quoradl and tagger resident, downloading jobs posted to a local port and re-indexing as answers land"
+    )
+    parser.add_argument("folder", metavar="FOLDER", help="path to markdown folder")
+    parser.add_argument(
+        "--port", type=int, default=8765, help="port to listen on (default 8765)"
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="address to listen on; keep this local, there's no authentication",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=2,
+        help="seconds between checks of the folder for new or changed files",
+    )
+    args = parser.parse_args()
+
+    server = JobServer((args.host, args.port), args.folder, args.interval)
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        server.server_close()
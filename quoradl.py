@@ -1,5 +1,3 @@
-from requests_html import HTMLSession, AsyncHTMLSession
-from bs4 import BeautifulSoup
 import json
 import logging
 import re
@@ -67,6 +65,24 @@ def recurse_expand_json(js):
             recurse_expand_json(js[k])
 
 
+_session = None
+
+
+def get_session():
+    """
+    Returns a shared HTMLSession, creating it on first use so that repeated
+    downloads (in `scrape` or the daemon) reuse the same connection pool
+    """
+    global _session
+    if _session is None:
+        # requests_html pulls in pyppeteer, lxml and friends, so only pay for
+        # it when we actually hit the network
+        from requests_html import HTMLSession
+
+        _session = HTMLSession()
+    return _session
+
+
 def get_quora_answer_data(URL):
     """
     Fetch a quora URL and parse out the answer data stashed in the window javascript
@@ -74,7 +90,7 @@ def get_quora_answer_data(URL):
     Recursively expand the "data" section of the parsed script (which is not always
     stored as a proper nested json blcb), returning it as a proper nested dictionary.
     """
-    session = HTMLSession()
+    session = get_session()
     htmlrequest = session.get(URL)
     data_script = None
 
@@ -179,8 +195,11 @@ def save_quora_answer(URL, filename=None, folder=None, force_lower=True):
     if folder:
         filename = os.path.join(folder, filename)
 
-    # write out the MD file
-    with open(f"{filename}", "w", encoding="utf-8") as out_file:
+    # write out the MD file.  It goes to a .part file first and is renamed
+    # when complete, so anything watching the folder (ie, tagger.py in the
+    # daemon) never sees a half-written answer
+    partial = f"{filename}.part"
+    with open(partial, "w", encoding="utf-8") as out_file:
 
 
         # lazy way wrangle the json payload
@@ -255,6 +274,7 @@ def save_quora_answer(URL, filename=None, folder=None, force_lower=True):
             if not is_code:
                 out_file.write("\n")
             last_was_code = is_code
+    os.replace(partial, filename)
     return True
 
 
@@ -279,6 +299,8 @@ def answers_from_quora_html(contentfile):
 
 
     """
+    # deferred for startup time -- see get_session()
+    from bs4 import BeautifulSoup
 
     with open(contentfile, "r", encoding="utf-8") as htmlist:
         contents = htmlist.read()
@@ -0,0 +1,71 @@
+import argparse
+import os
+import subprocess
+import sys
+
+
+# cumulative import budget, in milliseconds, for each of the scripts.  Both are
+# stdlib-only at import time and land around 20ms; bs4 + lxml add more than that
+# again, and requests_html several hundred, so if a module blows through the budget
+# it's probably
+# because something heavy (requests_html, bs4, lxml...) crept back into the
+# top-level imports instead of the code paths that need it
+BUDGETS = {"quoradl": 45, "tagger": 45}
+
+# the scripts aren't installed, so import them from next to this file
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def import_time(module, runs=5):
+    """
+    Returns the best cumulative import time for <module>, in milliseconds, as
+    reported by `python -X importtime`.  The best of several <runs> is used
+    to smooth out disk and scheduler noise.
+
+    Returns None if <module> fails to import.
+    """
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            cwd=HERE,
+        )
+        if result.returncode:
+            print(result.stderr.strip().splitlines()[-1], file=sys.stderr)
+            return None
+        # the last line of the report is the module itself; the
+        # cumulative column includes everything it dragged in
+        for line in result.stderr.splitlines():
+            fields = [f.strip() for f in line.split("|")]
+            if len(fields) == 3 and fields[-1] == module:
+                micros = int(fields[1])
+                break
+        else:
+            raise RuntimeError(f"no importtime report for {module}")
+        best = micros if best is None else min(best, micros)
+    return best / 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="check that the scripts import within their startup budget"
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="number of timed imports per module"
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for module, budget in BUDGETS.items():
+        elapsed = import_time(module, args.runs)
+        if elapsed is None:
+            print(f"{module:10}  IMPORT FAILED")
+            failed = True
+            continue
+        status = "ok" if elapsed <= budget else "OVER BUDGET"
+        print(f"{module:10} {elapsed:7.1f} ms  (budget {budget} ms)  {status}")
+        failed = failed or elapsed > budget
+
+    sys.exit(-1 if failed else 0)
@@ -1,262 +1,445 @@
 import re
-from collections import defaultdict
+from array import array
+from collections import defaultdict, namedtuple
 import logging
 import os
 import itertools
 import argparse
 
 
-def generate_indices(folder, threshhold=2):
+logger = logging.getLogger("tagger")
+logger.addHandler(logging.StreamHandler())
+logger.setLevel(logging.INFO)
+
+
+def parse_taglist(filename="taglist.txt"):
     """
-    Generates a tag list for a folder full of mardkown files, based on a weighted associative token search.
+    Parses <filename> (see generate_indices() for the format) and returns a
+    (tagdict, phrasedict, hierarchydict) tuple:
 
-    taglist.txt
-    --------------
-    The actual tags are found in the file taglist.txt. Each line in the file is a comma separated list of search terms
-    (lower cased) with the tag as the first item.  Items with variant, such as plural or adjectival forms, can be
-    specified with square brackets, so assyria[n]  will look for both 'assyria' and 'assyrian'. If a search term is
-    a phrase, enclose it in quotes ("roman republic"). Very common words like "a" and "the" are prefiltered for speed,
-    so for "alexander the great" you would use "alexander great".
+        tagdict:        search word -> tag
+        phrasedict:     tuple of search words -> tag
+        hierarchydict:  tag -> [parent tags]
+    """
+    tagdict = {}
+    phrasedict = {}
+    hierarchydict = {}
+    counter = 0
+    with open(filename, "rt") as taglist:
+        for line in taglist:
+            counter += 1
+            if len(line) < 2 or line.startswith("#"):
+                continue
+            tokens = [i.strip() for i in line.split(",")]
+            headword, *rest = tokens
+            tagdict[headword] = headword
+            hierarchydict[headword] = []
+            for r in rest:
+                # a leasing plus means "this tag is part of that tag"
+                # eg "+babylon" in "mesopotamia" means "anything tagged 'babylon'
+                # also gets mesopotamia"
+                if r.startswith("+"):
+                    hierarchydict[r[1:]].append(headword)
+                    continue
 
-    tags can include other tags. In the parent tag include the child prefixed by a plus.  Thus:
+                # multi-word cues are included w
+                if r.startswith('"'):
+                    assert r.endswith('"'), f"malformed quote in line {counter}"
+                    phrasedict[tuple(r[1:-1].split())] = headword
+                    continue
 
-        sparta, spartan[s], lacedaemon[ian], ....
-        greece, +athens, +sparta, greek, hellenic, ...
+                # word[ending] generates variants
+                if "[" in r or "]" in r:
+                    assert (
+                        "[" in r and "]" in r
+                    ), f"malformed ending in line {counter}"
+                    caret = r.index("[")
+                    tagdict[r[:caret]] = headword
+                    cleaned = r.replace("[", "").replace("]", "")
+                    tagdict[cleaned] = headword
+                    continue
 
-    will make sure the everything tagged 'sparta' is also tagged 'greece.'  The child tag should be defined before the parent,
-    as in the example here.
+                # or just add it
+                tagdict[r] = headword
 
-    lines in `taglist.txt` beginning with # will be ignored.
+    return tagdict, phrasedict, hierarchydict
 
-    associations
-    --------------
-    The tagging is associative, that is, for a text to be tagged it needs to have more than one of the keywords in tags.txt.
-    By default, tags are applied if two keywords are present; you can change this by passing a different value as the
-    `threshold` argument. The right value will depend on the nature of your tags, but generally setting this to one will generate
-    a lot of false positives and is probably not helpful.
 
-    output
-    -----
-    Running this generates index files in the same folder as the markdown.  There will be one index file for each tag in
-    taglist.text and for each year in the head matter of the markdown files. It will also generate am index of all tags
-    (in "index_tags.md") and an index of all years (in "index_years.md")
+def load_ignore_words(filename="ignore_words.txt"):
+    """
+    Returns the set of common words in <filename>.  These cannot be used as
+    keywords, so balance out speedups vs possible needs
     """
+    ignore = set()
+    with open(filename, "rt") as ignorefile:
+        for line in ignorefile:
+            ignore.add(line.strip())
+    return ignore
 
-    FOLDER = os.path.normpath(folder)
-    assert os.path.exists(FOLDER), f"folder '{FOLDER}' does not exist"
 
-    # higher numbers require more hits on more tags,
-    # lower numbers will favor the combination tags. A value larger than 1
-    # is good to avoid single-word mentions applying a tag
-    THRESHOLD = threshhold
+def extract_year(filename):
+    """
+    Returns the year from the 'written' line in the front matter of <filename>,
+    or None if there isn't one
+    """
+    with open(filename, "rt", encoding="utf-8") as thefile:
+        for line in thefile:
+            if line.strip().startswith("written"):
+                date = line.partition(":")[-1].strip()
+                return date.split("-")[0]
 
-    logger = logging.getLogger("tagger")
-    logger.addHandler(logging.StreamHandler())
-    logger.setLevel(logging.INFO)
 
-    tagdict = {}
-    phrasedict = {}
-    hierarchydict = {}
-    years = defaultdict(list)
-
-    # this parses the taglist.txt to generate the tag structure
-    def parse_taglist():
-        counter = 0
-        with open("taglist.txt", "rt") as taglist:
-            for line in taglist:
-                counter += 1
-                if len(line) < 2 or line.startswith("#"):
-                    continue
-                tokens = [i.strip() for i in line.split(",")]
-                headword, *rest = tokens
-                tagdict[headword] = headword
-                hierarchydict[headword] = []
-                for r in rest:
-                    # a leasing plus means "this tag is part of that tag"
-                    # eg "+babylon" in "mesopotamia" means "anything tagged 'babylon'
-                    # also gets mesopotamia"
-                    if r.startswith("+"):
-                        hierarchydict[r[1:]].append(headword)
-                        continue
-
-                    # multi-word cues are included w
-                    if r.startswith('"'):
-                        assert r.endswith('"'), f"malformed quote in line {counter}"
-                        phrasedict[tuple(r[1:-1].split())] = headword
-                        continue
-
-                    # word[ending] generates variants
-                    if "[" in r or "]" in r:
-                        assert (
-                            "[" in r and "]" in r
-                        ), f"malformed ending in line {counter}"
-                        caret = r.index("[")
-                        tagdict[r[:caret]] = headword
-                        cleaned = r.replace("[", "").replace("]", "")
-                        tagdict[cleaned] = headword
-                        continue
-
-                    # or just add it
-                    tagdict[r] = headword
-
-    # this generates the ignorelist of common words using ignore_words.txt
-    # these cannot be used as keywords, so balance out speedups vs possible needs
-    IGNORE = set()
-    with open("ignore_words.txt", "rt") as ignorefile:
-        for line in ignorefile:
-            IGNORE.add(line.strip())
-
-    # gets the cleaned up, non-excluded words in file <filename>
-    def extract_lexemes(filename):
-        with open(filename, "rt", encoding="utf-8") as thefile:
-            for line in thefile:
-                if line.strip().startswith("written"):
-                    date = line.partition(":")[-1].strip()
-                    date = date.split("-")[0]
-                    yfile = os.path.relpath(filename, FOLDER)
-                    years[date].append(yfile)
-                    break
-
-        with open(filename, "rt", encoding="utf-8") as thefile:
-
-            # include the question title in the lexeme generator..
-            title_tokens = iter(
-                os.path.basename(os.path.splitext(filename)[0]).lower().split("-")
-            )
-
-            raw_words = itertools.chain(
-                iter(thefile.read().replace("\u200b", " ").split()), title_tokens
-            )
-            remove_urls = (re.sub("\(.*\)", "", t) for t in raw_words)
-            remove_quora_links = (t for t in remove_urls if not t.startswith("/"))
-            remove_numbers = (re.sub("[\d]", "", t) for t in remove_quora_links)
-            lowered = (t.lower() for t in remove_numbers)
-            fix_quotes = (re.sub("[’'‘]", "'", t) for t in lowered)
-            depunctuated = (re.sub("[\?\.\!\,—;:]…", "", t) for t in fix_quotes)
-            dispossed = (re.sub("([’'][st])", "", t) for t in depunctuated)
-            unformattes = (re.sub("[\W]", "", t) for t in dispossed)
-            no_underscores = (re.sub("[_]", "", t) for t in unformattes)
-
-            # returns only the exclusives
-            return set(no_underscores).difference(IGNORE)
+def extract_lexemes(filename, ignore):
+    """
+    Returns the cleaned up words in <filename> which are not in <ignore>
+    """
+    with open(filename, "rt", encoding="utf-8") as thefile:
+
+        # include the question title in the lexeme generator..
+        title_tokens = iter(
+            os.path.basename(os.path.splitext(filename)[0]).lower().split("-")
+        )
+
+        raw_words = itertools.chain(
+            iter(thefile.read().replace("\u200b", " ").split()), title_tokens
+        )
+        remove_urls = (re.sub("\(.*\)", "", t) for t in raw_words)
+        remove_quora_links = (t for t in remove_urls if not t.startswith("/"))
+        remove_numbers = (re.sub("[\d]", "", t) for t in remove_quora_links)
+        lowered = (t.lower() for t in remove_numbers)
+        fix_quotes = (re.sub("[’'‘]", "'", t) for t in lowered)
+        depunctuated = (re.sub("[\?\.\!\,—;:]…", "", t) for t in fix_quotes)
+        dispossed = (re.sub("([’'][st])", "", t) for t in depunctuated)
+        unformattes = (re.sub("[\W]", "", t) for t in dispossed)
+        no_underscores = (re.sub("[_]", "", t) for t in unformattes)
+
+        # returns only the exclusives
+        return set(no_underscores).difference(ignore)
+
+
+# what we remember about each markdown file between scans
+FileEntry = namedtuple("FileEntry", "fid mtime tags year")
+
+# write buffer for the index files; tag indices for big archives run to
+# thousands of lines, so batch them up rather than flushing every 8k
+INDEX_BUFFER = 1 << 16
+
+
+class Tagger:
+    """
+    Tags the markdown files in <folder> and writes the tag and year indices.
+
+    The parsed taglist and the tags found in each file are kept around, so
+    calling scan() again only re-tags the files which have changed since the
+    last call.  generate_indices() uses this once; a long running process
+    (see daemon.py) can keep one alive and refresh just the affected indices.
+    """
+
+    def __init__(
+        self,
+        folder,
+        threshhold=2,
+        taglist="taglist.txt",
+        ignore_words="ignore_words.txt",
+    ):
+        self.folder = os.path.normpath(folder)
+        assert os.path.exists(self.folder), f"folder '{self.folder}' does not exist"
+
+        # higher numbers require more hits on more tags,
+        # lower numbers will favor the combination tags. A value larger than 1
+        # is good to avoid single-word mentions applying a tag
+        self.threshold = threshhold
+
+        self.tagdict, self.phrasedict, self.hierarchydict = parse_taglist(taglist)
+        self.ignore = load_ignore_words(ignore_words)
+
+        # shortpath: FileEntry
+        self.files = {}
+
+        # per-file data indexed by the integer file id.  The slots of removed
+        # files are set to None and their ids handed out again to new files,
+        # so the lists stay the size of the archive however much it churns
+        self.paths = []
+        # the "* [pretty name](/link)" line for each file, built once when it's
+        # first seen instead of once for every tag and year it is listed under
+        self.lines = []
+        self.free_ids = []
+
+        # shortpath: mtime of files which could not be tagged
+        self.failed = {}
+
+        # tag or year: array of file ids.  Ids are recycled, so their order
+        # means nothing; the index files are sorted by path when written
+        self.tag_postings = {}
+        self.year_postings = {}
 
     # see what tags are to be found in <filename>
-    def tag_file(filename):
-        lexemes = extract_lexemes(filename)
+    def tag_file(self, filename):
+        lexemes = extract_lexemes(filename, self.ignore)
 
         logger.info(f"{os.path.basename(filename)}\n    lexemes: {len(lexemes)}")
         keywords = defaultdict(int)
 
-        for eachtag in tagdict:
+        for eachtag in self.tagdict:
             if eachtag in lexemes:
-                head = tagdict[eachtag]
+                head = self.tagdict[eachtag]
                 keywords[head] += 1
 
-        for k, v in phrasedict.items():
+        for k, v in self.phrasedict.items():
             if all(item in lexemes for item in k):
                 keywords[v] += 1
 
         results = set()
         for k, v in keywords.items():
-            if v > THRESHOLD:
+            if v > self.threshold:
                 results.add(k)
 
         originals = [r for r in results]
         for t in originals:
-            for j in hierarchydict.get(t, []):
+            for j in self.hierarchydict.get(t, []):
                 results.add(j)
 
         logger.info(f"   {tuple(results)}")
         return results
 
+    def scan(self):
+        """
+        Walks the folder, tagging any markdown file which is new or has been
+        modified since the last scan and forgetting any which have gone away.
+
+        Returns a (tags, years) tuple of the sets of tags and years whose file
+        lists may have changed
+        """
+        folderpath = os.path.normpath(os.path.abspath(self.folder))
+        changed_tags = set()
+        changed_years = set()
+        seen = set()
+
+        for root, _, files in os.walk(self.folder):
+            for f in files:
+                lowered = f.lower()
+                if lowered.startswith("tag_") or lowered.startswith("year_"):
+                    continue
+                if lowered.startswith("index_"):
+                    continue
+                if lowered in ("topics.md", "readme.md"):
+                    continue
+                if not lowered.endswith(".md"):
+                    continue
 
-    # global indices
-    # -------------
-    # tag: [list of files matching tag]
-    files_per_tag = defaultdict(list)
-    # file: [tags]
-    tags_per_file = {}
-    parse_taglist()
-
-    for root, _, files in os.walk(FOLDER):
-
-        folderpath = os.path.normpath(os.path.abspath(FOLDER))
+                # note there are issue here if for some reason the
+                # file names are not lower-cased; the links will work
+                # on a case-insensitive file system but not on github
+                fullpath = os.path.normpath(os.path.join(root, f))
+                shortpath = os.path.relpath(fullpath, folderpath)
+                seen.add(shortpath)
+
+                try:
+                    mtime = os.stat(fullpath).st_mtime_ns
+                except OSError:
+                    # deleted since the walk; it'll be dropped next scan
+                    continue
 
-        for f in files:
-            f = f.lower()
-            if f.startswith("tag_") or f.startswith("year_"):
-                continue
-            if f in ("topics.md", "readme.md"):
+                # a file that can't be read -- usually one that is still being
+                # written -- is skipped without being recorded, so it's tried
+                # again once it changes.  Only complain once per version
+                if self.failed.get(shortpath) == mtime:
+                    continue
+                try:
+                    touched = self._scan_file(fullpath, shortpath, mtime)
+                except (OSError, ValueError) as err:
+                    logger.warning(f"could not tag {shortpath}: {err}")
+                    self.failed[shortpath] = mtime
+                    continue
+                self.failed.pop(shortpath, None)
+
+                for entry in touched:
+                    changed_tags.update(entry.tags)
+                    changed_years.add(entry.year)
+
+        for shortpath in set(self.failed).difference(seen):
+            del self.failed[shortpath]
+
+        for shortpath in set(self.files).difference(seen):
+            previous = self.files.pop(shortpath)
+            logger.info(f"{os.path.basename(shortpath)} removed")
+            self._unpost(previous)
+            self.paths[previous.fid] = None
+            self.lines[previous.fid] = None
+            self.free_ids.append(previous.fid)
+            changed_tags.update(previous.tags)
+            changed_years.add(previous.year)
+
+        changed_years.discard(None)
+        return changed_tags, changed_years
+
+    def _scan_file(self, fullpath, shortpath, mtime):
+        """
+        Re-tags <fullpath> if <mtime> differs from the last scan.  Returns a
+        list of the old and new FileEntries which were swapped, or an empty
+        list if the file is unchanged
+        """
+        previous = self.files.get(shortpath)
+        if previous and previous.mtime == mtime:
+            return []
+
+        # read the file before touching any state, so if it fails halfway
+        # the postings still match self.files
+        tags = self.tag_file(fullpath)
+        year = extract_year(fullpath)
+
+        if previous:
+            fid = previous.fid
+            self._unpost(previous)
+        else:
+            fid = self._add_file(shortpath)
+
+        entry = FileEntry(fid, mtime, tags, year)
+        self.files[shortpath] = entry
+        self._post(entry)
+        return [previous, entry] if previous else [entry]
+
+    def _add_file(self, shortpath):
+        prettyname = os.path.splitext(os.path.basename(shortpath))[0]
+        prettyname = prettyname.split("\\")[-1]
+        prettyname = prettyname.replace("-", " ").title()
+        prettyname += "?"
+        # if the file casing is off these links will appear broken
+        outfile = shortpath.replace("\\", "/")
+
+        line = f"* [{prettyname}](/{outfile})\n"
+
+        if self.free_ids:
+            fid = self.free_ids.pop()
+            self.paths[fid] = shortpath
+            self.lines[fid] = line
+            return fid
+
+        self.paths.append(shortpath)
+        self.lines.append(line)
+        return len(self.paths) - 1
+
+    def _post(self, entry):
+        for t in entry.tags:
+            self.tag_postings.setdefault(t, array("I")).append(entry.fid)
+        if entry.year is not None:
+            self.year_postings.setdefault(entry.year, array("I")).append(entry.fid)
+
+    def _unpost(self, entry):
+        keys = [(self.tag_postings, t) for t in entry.tags]
+        if entry.year is not None:
+            keys.append((self.year_postings, entry.year))
+        for postings, key in keys:
+            postings[key].remove(entry.fid)
+            if not postings[key]:
+                del postings[key]
+
+    def _write_index(self, filename, title, fids):
+        with open(filename, "wt", buffering=INDEX_BUFFER) as index:
+            index.write(f"# {title}\n")
+            index.write(f"{len(fids)} items\n")
+            index.write("\n")
+            index.writelines(self.lines[fid] for fid in fids)
+
+    def write_indices(self, tags=None, years=None):
+        """
+        Writes the tag_*.md and year_*.md files for <tags> and <years> -- or for
+        all of them if not supplied -- followed by index_tags.md and
+        index_years.md.  Index files for tags or years which no longer have
+        any files are removed.
+        """
+        if tags is None:
+            tags = list(self.tag_postings)
+        if years is None:
+            years = list(self.year_postings)
+
+        # generate tag indices
+        for eachtag in tags:
+            safename = eachtag.replace(" ", "-")
+            filename = os.path.normpath(os.path.join(self.folder, f"tag_{safename}.md"))
+            if eachtag not in self.tag_postings:
+                if os.path.exists(filename):
+                    os.remove(filename)
+                    logger.info(f"removed tag {eachtag}")
                 continue
-            if not f.endswith(".md"):
+            file_list = sorted(self.tag_postings[eachtag], key=self.paths.__getitem__)
+            self._write_index(filename, eachtag, file_list)
+            logger.info(f"wrote tag {eachtag}")
+
+        # generate year files
+        for year in sorted(years):
+            filename = os.path.normpath(os.path.join(self.folder, f"year_{year}.md"))
+            if year not in self.year_postings:
+                if os.path.exists(filename):
+                    os.remove(filename)
+                    logger.info(f"removed year {year}")
                 continue
+            file_list = sorted(self.year_postings[year], key=self.paths.__getitem__)
+            self._write_index(filename, year, file_list)
+            logger.info(f"wrote year {year}")
 
-            # note there are issue here if for some reason the
-            # file names are not lower-cased; this will show up
-            # as links that look right but don't work on github
-            fullpath = os.path.normpath(os.path.join(root, f))
-            shortpath = os.path.relpath(fullpath, folderpath)
-            file_tags = tag_file(fullpath)
-            tags_per_file[shortpath] = file_tags
-            for t in file_tags:
-                files_per_tag[t].append(shortpath)
-
-
-    # generate tag indices
-    for eachtag in files_per_tag:
-        safename = eachtag.replace(" ", "-")
-        filename = os.path.normpath(os.path.join(FOLDER, f"tag_{safename}.md"))
-        with open(filename, "wt") as tagindex:
-            tagindex.write(f"# {eachtag}\n")
-            tagindex.write(f"{len(files_per_tag[eachtag])} items\n")
-            tagindex.write("\n")
-            for eachfile in files_per_tag[eachtag]:
-                prettyname = os.path.splitext(os.path.basename(eachfile))[0]
-                prettyname = prettyname.split("\\")[-1]
-                prettyname = prettyname.replace("-", " ").title()
-                prettyname += "?"
-                outfile = eachfile.replace("\\", "/")
-                tagindex.write(f"* [{prettyname}](/{outfile})\n")
-            logger.info(f"wrote tag {eachtag}")
+        year_index_file = os.path.normpath(os.path.join(self.folder, f"index_years.md"))
 
-    # generate year files
-    for year in sorted(years.keys()):
-        file_list = sorted(years[year])
-        filename = os.path.normpath(os.path.join(FOLDER, f"year_{year}.md"))
-        with open(filename, "wt") as yearindex:
-            yearindex.write(f"# {year}\n")
-            yearindex.write(f"{len(years[year])} items\n")
+        with open(year_index_file, "wt") as yearindex:
+            yearindex.write(f"# Articles by year\n")
+            yearindex.write(f"{len(self.year_postings)} items\n")
             yearindex.write("\n")
-            for eachfile in file_list:
-                prettyname = os.path.splitext(os.path.basename(eachfile))[0]
-                prettyname = prettyname.split("\\")[-1]
-                prettyname = prettyname.replace("-", " ").title()
-                prettyname += "?"
-                outfile = eachfile.replace("\\", "/")
-                # again, if the file casing is off these
-                # links will appear broken
-                yearindex.write(f"* [{prettyname}](/{outfile})\n")
-            logger.info(f"wrote year {year}")
+            for year in sorted(self.year_postings.keys()):
+                yearindex.write(
+                    f"* [{year}](year_{year}.md) ({len(self.year_postings[year])})\n"
+                )
+
+        tag_index_file = os.path.normpath(os.path.join(self.folder, "index_tags.md"))
+        with open(tag_index_file, "wt") as tagindex:
+            tagindex.write(f"# Tagged articles\n")
+            tagindex.write(f"{len(self.tag_postings)} items\n")
+            tagindex.write("\n")
+            for eachtag in sorted(self.tag_postings.keys()):
+                safename = eachtag.replace(" ", "-")
+                tagindex.write(
+                    f'* ["{eachtag.title()}"](tag_{safename}.md) ({len(self.tag_postings[eachtag])})\n'
+                )
 
-    year_index_file = os.path.normpath(os.path.join(FOLDER, f"index_years.md"))
-
-    with open(year_index_file, "wt") as yearindex:
-        yearindex.write(f"# Articles by year\n")
-        yearindex.write(f"{len(years[year])} items\n")
-        yearindex.write("\n")
-        for year in sorted(years.keys()):
-            yearindex.write(f"* [{year}](year_{year}.md) ({len(years[year])})\n")
-
-    tag_index_file = os.path.normpath(os.path.join(FOLDER, "index_tags.md"))
-    with open(tag_index_file, "wt") as tagindex:
-        tagindex.write(f"# Tagged articles\n")
-        tagindex.write(f"{len(files_per_tag)} items\n")
-        tagindex.write("\n")
-        for eachtag in sorted(files_per_tag.keys()):
-            safename = eachtag.replace(" ", "-")
-            tagindex.write(
-                f'* ["{eachtag.title()}"](tag_{safename}.md) ({len(files_per_tag[eachtag])})\n'
-            )
+
+def generate_indices(folder, threshhold=2):
+    """
+    Generates a tag list for a folder full of mardkown files, based on a weighted associative token search.
+
+    taglist.txt
+    --------------
+    The actual tags are found in the file taglist.txt. Each line in the file is a comma separated list of search terms
+    (lower cased) with the tag as the first item.  Items with variant, such as plural or adjectival forms, can be
+    specified with square brackets, so assyria[n]  will look for both 'assyria' and 'assyrian'. If a search term is
+    a phrase, enclose it in quotes ("roman republic"). Very common words like "a" and "the" are prefiltered for speed,
+    so for "alexander the great" you would use "alexander great".
+
+    tags can include other tags. In the parent tag include the child prefixed by a plus.  Thus:
+
+        sparta, spartan[s], lacedaemon[ian], ....
+        greece, +athens, +sparta, greek, hellenic, ...
+
+    will make sure the everything tagged 'sparta' is also tagged 'greece.'  The child tag should be defined before the parent,
+    as in the example here.
+
+    lines in `taglist.txt` beginning with # will be ignored.
+
+    associations
+    --------------
+    The tagging is associative, that is, for a text to be tagged it needs to have more than one of the keywords in tags.txt.
+    By default, tags are applied if two keywords are present; you can change this by passing a different value as the
+    `threshold` argument. The right value will depend on the nature of your tags, but generally setting this to one will generate
+    a lot of false positives and is probably not helpful.
+
+    output
+    -----
+    Running this generates index files in the same folder as the markdown.  There will be one index file for each tag in
+    taglist.text and for each year in the head matter of the markdown files. It will also generate am index of all tags
+    (in "index_tags.md") and an index of all years (in "index_years.md")
+    """
+
+    tagger = Tagger(folder, threshhold)
+    tagger.scan()
+    tagger.write_indices()
 
 
 if __name__ == "__main__":